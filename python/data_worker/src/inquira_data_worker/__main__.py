@@ -11,17 +11,21 @@ from .runtime import WorkerRuntime
 
 async def _serve() -> None:
     runtime = WorkerRuntime()
+    requests = sys.stdin.buffer
+    output = sys.stdout.buffer
     output_lock = asyncio.Lock()
     tasks: set[asyncio.Task[None]] = set()
 
     async def write(payload: dict) -> None:
+        line = (json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8")
         async with output_lock:
-            print(json.dumps(payload, ensure_ascii=False), flush=True)
+            output.write(line)
+            output.flush()
 
-    async def handle_line(line: str) -> None:
+    async def handle_line(line: bytes) -> None:
         try:
             request = json.loads(line)
-        except json.JSONDecodeError:
+        except ValueError:
             await write({"id": None, "result": None, "error": {"code": "invalid_json", "message": "Request was not valid JSON."}})
             return
 
@@ -35,8 +39,8 @@ async def _serve() -> None:
 
     try:
         while True:
-            line = await asyncio.to_thread(sys.stdin.readline)
-            if line == "":
+            line = await asyncio.to_thread(requests.readline)
+            if not line:
                 break
             task = asyncio.create_task(handle_line(line))
             tasks.add(task)
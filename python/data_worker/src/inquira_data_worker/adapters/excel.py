@@ -5,12 +5,12 @@ from __future__ import annotations
 import datetime as dt
 import hashlib
 import shutil
+import stat
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Iterable
 
 import duckdb
-from openpyxl import load_workbook
 
 from ..errors import AdapterError
 from ..models import (
@@ -23,7 +23,7 @@ from ..models import (
     Preview,
     SourceObject,
 )
-from .file import MAX_PREVIEW_ROWS, _fingerprint, _json_value, _sql_string
+from .file import MAX_PREVIEW_ROWS, _fingerprint, _insert_rows, _json_value, _source_status, _sql_string
 
 SHEET_PREFIX = "sheet:"
 INSERT_BATCH_SIZE = 1000
@@ -158,13 +158,12 @@ class ExcelAdapter:
         if not str(value or "").strip():
             raise AdapterError("invalid_params", "A source path is required.")
         raw = Path(value).expanduser()
-        if not raw.exists():
-            raise AdapterError("source_not_found", f"Source file does not exist: {raw}")
-        if not raw.is_file():
+        status = _source_status(raw)
+        if not stat.S_ISREG(status.st_mode):
             raise AdapterError("source_not_file", "Source path must be a regular file.")
         if raw.suffix.lower() != self.suffix:
             raise AdapterError("source_extension_mismatch", "Expected a .xlsx file extension.")
-        if raw.stat().st_size == 0:
+        if status.st_size == 0:
             raise AdapterError("source_unreadable", "Could not read excel source: file is empty.")
         return raw.resolve(strict=True)
 
@@ -175,6 +174,9 @@ class ExcelAdapter:
         return mode
 
     def _open(self, path: Path, formula_mode: str):
+        # Imported lazily to keep worker start-up fast.
+        from openpyxl import load_workbook
+
         try:
             return load_workbook(
                 path,
@@ -321,7 +323,6 @@ class ExcelAdapter:
                 f"{_quote_identifier(column.name)} {column.data_type}" for column in analysis.columns
             )
             connection.execute(f"CREATE TABLE sheet_data ({definitions})")
-            placeholders = ", ".join("?" for _ in analysis.columns)
             iterator = iter(_nonempty_rows(sheet))
             next(iterator, None)
             batch: list[list[Any]] = []
@@ -331,10 +332,10 @@ class ExcelAdapter:
                     for index, column in enumerate(analysis.columns)
                 ])
                 if len(batch) == INSERT_BATCH_SIZE:
-                    connection.executemany(f"INSERT INTO sheet_data VALUES ({placeholders})", batch)
+                    _insert_rows(connection, "sheet_data", batch, len(analysis.columns))
                     batch.clear()
             if batch:
-                connection.executemany(f"INSERT INTO sheet_data VALUES ({placeholders})", batch)
+                _insert_rows(connection, "sheet_data", batch, len(analysis.columns))
             connection.execute(f"COPY sheet_data TO {_sql_string(output)} (FORMAT PARQUET)")
         finally:
             connection.close()
@@ -4,13 +4,18 @@ from __future__ import annotations
 
 import datetime as dt
 import decimal
+import errno
 import hashlib
+import os
+import stat
+import threading
 from pathlib import Path
 from typing import Any
 
 import duckdb
 
 from ..errors import AdapterError
+from ..stat_cache import StatCache
 from ..models import (
     AdapterRequest,
     Column,
@@ -24,11 +29,40 @@ from ..models import (
 
 MAX_PREVIEW_ROWS = 1000
 
+MAX_CACHED_FINGERPRINTS = 256
+
+_database: duckdb.DuckDBPyConnection | None = None
+_database_lock = threading.Lock()
+_fingerprints: StatCache[str] = StatCache(MAX_CACHED_FINGERPRINTS)
+
 
 def _sql_string(value: str | Path) -> str:
     return "'" + str(value).replace("'", "''") + "'"
 
 
+def _cursor() -> duckdb.DuckDBPyConnection:
+    global _database
+    with _database_lock:
+        if _database is None:
+            _database = duckdb.connect()
+        return _database.cursor()
+
+
+def _insert_rows(connection: duckdb.DuckDBPyConnection, table: str, rows: list[list[Any]], width: int) -> None:
+    import numpy
+
+    batch: dict[str, numpy.ndarray] = {}
+    for index in range(width):
+        column = numpy.empty(len(rows), dtype=object)
+        column[:] = [row[index] for row in rows]
+        batch[f"column_{index}"] = column
+    connection.register("inquira_batch", batch)
+    try:
+        connection.execute(f"INSERT INTO {table} SELECT * FROM inquira_batch")
+    finally:
+        connection.unregister("inquira_batch")
+
+
 def _json_value(value: Any) -> Any:
     if isinstance(value, (dt.date, dt.datetime, dt.time)):
         return value.isoformat()
@@ -45,12 +79,24 @@ def _json_value(value: Any) -> Any:
     return value
 
 
-def _fingerprint(path: Path) -> str:
-    digest = hashlib.sha256()
+def _source_status(raw: Path) -> os.stat_result:
+    try:
+        return raw.stat()
+    except OSError as exc:
+        if exc.errno not in (errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP):
+            raise
+    except ValueError:
+        pass
+    raise AdapterError("source_not_found", f"Source file does not exist: {raw}")
+
+
+def _digest(path: Path) -> str:
     with path.open("rb") as handle:
-        while chunk := handle.read(1024 * 1024):
-            digest.update(chunk)
-    return "sha256:" + digest.hexdigest()
+        return "sha256:" + hashlib.file_digest(handle, hashlib.sha256).hexdigest()
+
+
+def _fingerprint(path: Path) -> str:
+    return _fingerprints.get(path, lambda: _digest(path))
 
 
 class FileAdapter:
@@ -62,23 +108,22 @@ class FileAdapter:
         if not str(value or "").strip():
             raise AdapterError("invalid_params", "A source path is required.")
         raw = Path(value).expanduser()
-        if not raw.exists():
-            raise AdapterError("source_not_found", f"Source file does not exist: {raw}")
-        if not raw.is_file():
+        status = _source_status(raw)
+        if not stat.S_ISREG(status.st_mode):
             raise AdapterError("source_not_file", "Source path must be a regular file.")
         if raw.suffix.lower() not in self.suffixes:
             expected = ", ".join(self.suffixes)
             raise AdapterError("source_extension_mismatch", f"Expected one of these file extensions: {expected}.")
-        if raw.stat().st_size == 0:
+        if status.st_size == 0:
             raise AdapterError("source_unreadable", f"Could not read {self.kind} source: file is empty.")
         return raw.resolve(strict=True)
 
     def _relation(self, path: Path) -> str:
         return f"{self.reader}({_sql_string(path)})"
 
-    def _columns(self, connection: duckdb.DuckDBPyConnection, path: Path) -> list[Column]:
+    def _columns(self, connection: duckdb.DuckDBPyConnection, relation: str) -> list[Column]:
         try:
-            rows = connection.execute(f"DESCRIBE SELECT * FROM {self._relation(path)}").fetchall()
+            rows = connection.execute(f"DESCRIBE SELECT * FROM {relation}").fetchall()
         except Exception as exc:
             raise AdapterError("source_unreadable", f"Could not read {self.kind} source: {exc}") from exc
         if not rows:
@@ -87,9 +132,9 @@ class FileAdapter:
 
     def discover(self, request: AdapterRequest) -> Discovery:
         path = self._source(request.source_path)
-        connection = duckdb.connect()
+        connection = _cursor()
         try:
-            columns = self._columns(connection, path)
+            columns = self._columns(connection, self._relation(path))
         finally:
             connection.close()
         return Discovery(
@@ -103,16 +148,17 @@ class FileAdapter:
         if limit < 1 or limit > MAX_PREVIEW_ROWS:
             raise AdapterError("invalid_preview_limit", f"Preview limit must be between 1 and {MAX_PREVIEW_ROWS}.")
         path = self._source(request.source_path)
-        connection = duckdb.connect()
+        connection = _cursor()
         try:
-            columns = self._columns(connection, path)
-            rows = connection.execute(f"SELECT * FROM {self._relation(path)} LIMIT ?", [limit + 1]).fetchall()
-        except AdapterError:
-            raise
+            cursor = connection.execute(f"SELECT * FROM {self._relation(path)} LIMIT ?", [limit + 1])
+            columns = [Column(name=str(item[0]), data_type=str(item[1])) for item in cursor.description or []]
+            rows = cursor.fetchall()
         except Exception as exc:
             raise AdapterError("source_unreadable", f"Could not read {self.kind} source: {exc}") from exc
         finally:
             connection.close()
+        if not columns:
+            raise AdapterError("source_unreadable", f"Could not read {self.kind} source: no columns found.")
         names = [column.name for column in columns]
         return Preview(
             columns=columns,
@@ -130,15 +176,18 @@ class FileAdapter:
         target.mkdir(parents=True, exist_ok=True)
         output = target / "data.parquet"
         before = _fingerprint(path)
-        connection = duckdb.connect()
+        connection = _cursor()
         try:
-            columns = self._columns(connection, path)
-            connection.execute(
+            row_count = int(connection.execute(
                 f"COPY (SELECT * FROM {self._relation(path)}) TO {_sql_string(output)} (FORMAT PARQUET)"
-            )
-            row_count = int(connection.execute(f"SELECT count(*) FROM read_parquet({_sql_string(output)})").fetchone()[0])
+            ).fetchone()[0])
+            columns = self._columns(connection, f"read_parquet({_sql_string(output)})")
         except AdapterError:
+            output.unlink(missing_ok=True)
             raise
+        except (duckdb.InvalidInputException, duckdb.ConversionException) as exc:
+            output.unlink(missing_ok=True)
+            raise AdapterError("source_unreadable", f"Could not read {self.kind} source: {exc}") from exc
         except Exception as exc:
             output.unlink(missing_ok=True)
             raise AdapterError("materialization_failed", f"Could not materialize {self.kind} source: {exc}") from exc
@@ -7,17 +7,18 @@ from .excel import ExcelAdapter
 from .file import CSVAdapter, FileAdapter, JSONAdapter, ParquetAdapter
 from .sqlite import SQLiteAdapter
 
+_ADAPTERS: dict[str, type[FileAdapter | ExcelAdapter | SQLiteAdapter]] = {
+    "csv": CSVAdapter,
+    "parquet": ParquetAdapter,
+    "excel": ExcelAdapter,
+    "json": JSONAdapter,
+    "sqlite": SQLiteAdapter,
+}
+
 
 def get_adapter(kind: str) -> FileAdapter | ExcelAdapter | SQLiteAdapter:
     normalized = str(kind or "").strip().lower()
-    if normalized == "csv":
-        return CSVAdapter()
-    if normalized == "parquet":
-        return ParquetAdapter()
-    if normalized == "excel":
-        return ExcelAdapter()
-    if normalized == "json":
-        return JSONAdapter()
-    if normalized == "sqlite":
-        return SQLiteAdapter()
-    raise AdapterError("adapter_not_supported", f"Adapter {normalized or '(empty)'} is not supported yet.")
+    adapter = _ADAPTERS.get(normalized)
+    if adapter is None:
+        raise AdapterError("adapter_not_supported", f"Adapter {normalized or '(empty)'} is not supported yet.")
+    return adapter()
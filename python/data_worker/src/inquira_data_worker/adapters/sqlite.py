@@ -5,6 +5,7 @@ from __future__ import annotations
 import hashlib
 import shutil
 import sqlite3
+import stat
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Iterable
@@ -22,7 +23,7 @@ from ..models import (
     Preview,
     SourceObject,
 )
-from .file import MAX_PREVIEW_ROWS, _json_value, _sql_string
+from .file import MAX_PREVIEW_ROWS, _insert_rows, _json_value, _source_status, _sql_string
 
 INSERT_BATCH_SIZE = 1000
 OBJECT_KINDS = {"table", "view"}
@@ -117,16 +118,15 @@ class SQLiteAdapter:
         if not str(value or "").strip():
             raise AdapterError("invalid_params", "A source path is required.")
         raw = Path(value).expanduser()
-        if not raw.exists():
-            raise AdapterError("source_not_found", f"Source file does not exist: {raw}")
-        if not raw.is_file():
+        status = _source_status(raw)
+        if not stat.S_ISREG(status.st_mode):
             raise AdapterError("source_not_file", "Source path must be a regular file.")
         if raw.suffix.lower() not in SQLITE_SUFFIXES:
             raise AdapterError(
                 "source_extension_mismatch",
                 "Expected a .sqlite, .sqlite3, or .db file extension.",
             )
-        if raw.stat().st_size == 0:
+        if status.st_size == 0:
             raise AdapterError("source_unreadable", "Could not read sqlite source: file is empty.")
         return raw.resolve(strict=True)
 
@@ -174,12 +174,11 @@ class SQLiteAdapter:
             for kind, name in rows
         ]
 
-    def _resolve_object(self, objects: list[_SQLiteObject], object_id: str) -> _SQLiteObject:
-        normalized = str(object_id or "")
-        for item in objects:
-            if item.object_id == normalized:
-                return item
-        raise AdapterError("source_selection_missing", "The selected SQLite table or view no longer exists.")
+    def _resolve_object(self, objects: dict[str, _SQLiteObject], object_id: str) -> _SQLiteObject:
+        source = objects.get(str(object_id or ""))
+        if source is None:
+            raise AdapterError("source_selection_missing", "The selected SQLite table or view no longer exists.")
+        return source
 
     def _declared_types(
         self,
@@ -189,7 +188,7 @@ class SQLiteAdapter:
     ) -> list[str]:
         try:
             rows = connection.execute(f"PRAGMA table_xinfo({_quote_identifier(source.name)})").fetchall()
-        except Exception:
+        except sqlite3.Error:
             rows = []
         visible = [row for row in rows if len(row) < 7 or int(row[6] or 0) != 1]
         values = [_declared_type(str(row[2] or "")) for row in visible[:width]]
@@ -267,7 +266,8 @@ class SQLiteAdapter:
         path = self._source(request.source_path)
         connection = self._open(path)
         try:
-            source = self._resolve_object(self._objects(connection), request.source_object_id)
+            objects = {item.object_id: item for item in self._objects(connection)}
+            source = self._resolve_object(objects, request.source_object_id)
             analysis = self._analyse(connection, source, limit + 1)
             cursor = connection.execute(
                 f"SELECT * FROM {_quote_identifier(source.name)} LIMIT {limit + 1}"
@@ -305,7 +305,7 @@ class SQLiteAdapter:
         outputs: list[MaterializedOutput] = []
         try:
             connection.execute("BEGIN")
-            objects = self._objects(connection)
+            objects = {item.object_id: item for item in self._objects(connection)}
             sources = [self._resolve_object(objects, item) for item in selected]
             analyses = [self._analyse(connection, item, None) for item in sources]
             target.mkdir(parents=True, exist_ok=True)
@@ -352,7 +352,6 @@ class SQLiteAdapter:
                 f"{_quote_identifier(column.name)} {column.data_type}" for column in analysis.columns
             )
             database.execute(f"CREATE TABLE snapshot_data ({definitions})")
-            placeholders = ", ".join("?" for _ in analysis.columns)
             cursor = connection.execute(f"SELECT * FROM {_quote_identifier(source.name)}")
             while rows := cursor.fetchmany(INSERT_BATCH_SIZE):
                 converted = [
@@ -362,7 +361,7 @@ class SQLiteAdapter:
                     ]
                     for row in rows
                 ]
-                database.executemany(f"INSERT INTO snapshot_data VALUES ({placeholders})", converted)
+                _insert_rows(database, "snapshot_data", converted, len(analysis.columns))
             database.execute(f"COPY snapshot_data TO {_sql_string(output)} (FORMAT PARQUET)")
         finally:
             database.close()
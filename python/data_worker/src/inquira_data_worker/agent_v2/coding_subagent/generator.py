@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import warnings
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Awaitable, Callable
 
@@ -24,6 +25,7 @@ class StructuredOutputEmptyError(ValueError):
     """Raised when structured parsing produces no usable payload."""
 
 
+@lru_cache(maxsize=1)
 def _build_coding_prompt() -> ChatPromptTemplate:
     return ChatPromptTemplate.from_messages(
         [
@@ -6,6 +6,7 @@ import asyncio
 import ast
 import contextvars
 import json
+import os
 import re
 import time
 import warnings
@@ -937,8 +938,8 @@ def _data_path_mtime_ns(data_path: str | None) -> int:
     if not path:
         return 0
     try:
-        return int(Path(path).expanduser().stat().st_mtime_ns)
-    except Exception:
+        return int(os.stat(os.path.expanduser(path)).st_mtime_ns)
+    except (OSError, ValueError):
         return 0
 
 
@@ -2375,13 +2376,7 @@ _PARALLEL_READ_ONLY_TOOL_NAMES = {
 
 def _analysis_data_mtime_ns(state: dict[str, Any]) -> int:
     analysis_context = state.get("analysis_context") if isinstance(state.get("analysis_context"), dict) else {}
-    data_path = str(analysis_context.get("data_path") or "").strip()
-    if not data_path:
-        return 0
-    try:
-        return int(Path(data_path).expanduser().stat().st_mtime_ns)
-    except Exception:
-        return 0
+    return _data_path_mtime_ns(analysis_context.get("data_path"))
 
 
 def _normalized_tool_cache_key(state: dict[str, Any], tool_name: str, args: dict[str, Any]) -> str:
@@ -40,6 +40,11 @@ _DISCUSSION_TOPIC_RE = re.compile(
     r"\b(method|methodology|approach|reasoning|logic|criteria|assumptions|analysis|result|answer|finding|findings)\b",
     re.IGNORECASE,
 )
+_WHITESPACE_RE = re.compile(r"\s+")
+_ANALYSIS_HINTS_RE = re.compile(
+    r"\b(chart|plot|graph|sql|query|average|sum|count|group by|dataset|table|column)\b",
+    re.IGNORECASE,
+)
 _EXECUTION_INTENT_RE = re.compile(
     r"\b(run|rerun|execute|generate|write|produce|build|create|query|calculate|compute|find|show me|give me|list|plot|chart|graph)\b",
     re.IGNORECASE,
@@ -55,7 +60,7 @@ class RouteDecision(BaseModel):
 
 
 def _summarize_user_text(user_text: str, limit: int = 120) -> str:
-    text = re.sub(r"\s+", " ", str(user_text or "")).strip()
+    text = _WHITESPACE_RE.sub(" ", str(user_text or "")).strip()
     if not text:
         return "your request"
     if len(text) <= limit:
@@ -254,11 +259,7 @@ async def decide_route_details(messages: list[AnyMessage], configurable: dict) -
     except Exception:
         pass
 
-    analysis_hints = re.compile(
-        r"\b(chart|plot|graph|sql|query|average|sum|count|group by|dataset|table|column)\b",
-        re.IGNORECASE,
-    )
-    fallback_route = "analysis" if analysis_hints.search(user_text) else "general_chat"
+    fallback_route = "analysis" if _ANALYSIS_HINTS_RE.search(user_text) else "general_chat"
     return RouteDecision(route=fallback_route, reasoning=_fallback_reasoning(fallback_route, user_text))
 
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Callable
 
 from langchain_core.language_models.chat_models import BaseChatModel
@@ -177,6 +178,11 @@ def create_chat_model(
         max_retries=max_retries,
         timeout=timeout,
     )
-    model_instance = builder(settings)
-    setattr(model_instance, "_inquira_provider", provider_name)
+    return _cached_chat_model(settings)
+
+
+@lru_cache(maxsize=16)
+def _cached_chat_model(settings: ChatModelSettings) -> BaseChatModel:
+    model_instance = _PROVIDER_BUILDERS[settings.provider](settings)
+    setattr(model_instance, "_inquira_provider", settings.provider)
     return model_instance
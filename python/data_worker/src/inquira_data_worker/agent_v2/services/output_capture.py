@@ -8,6 +8,8 @@ import re
 from typing import Any
 
 
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
 _KIND_ALIASES = {
     "dataframe": "dataframe",
     "pandas": "dataframe",
@@ -37,7 +39,7 @@ def _normalize_capture_candidate_names(candidates: Any, *, max_items: int = 24)
         name = str(item or "").strip()
         if not name:
             continue
-        if re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", name) is None:
+        if _IDENTIFIER_RE.fullmatch(name) is None:
             continue
         if name in seen:
             continue
@@ -67,7 +69,7 @@ def infer_capture_candidate_names(code: Any, *, max_items: int = 24) -> list[str
         name = str(raw or "").strip()
         if not name:
             return
-        if re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", name) is None:
+        if _IDENTIFIER_RE.fullmatch(name) is None:
             return
         if name in seen:
             return
@@ -123,7 +125,7 @@ def normalize_output_contract(contract: Any, *, max_items: int = 8) -> list[dict
         if not isinstance(item, dict):
             continue
         raw_name = str(item.get("name") or "").strip()
-        if not raw_name or re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", raw_name) is None:
+        if not raw_name or _IDENTIFIER_RE.fullmatch(raw_name) is None:
             continue
         key = raw_name.lower()
         if key in seen:
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
+import os
 from functools import lru_cache
-from pathlib import Path
 import time
 from typing import Any
 
@@ -138,16 +138,12 @@ def _best_match_rank(
     return best_rank, matched_queries
 
 
-def _quote_identifier(identifier: str) -> str:
-    return f'"{identifier.replace(chr(34), chr(34) * 2)}"'
-
-
 def _workspace_db_mtime_ns(data_path: str | None) -> int:
     if not data_path:
         return 0
     try:
-        return int(Path(data_path).stat().st_mtime_ns)
-    except Exception:
+        return int(os.stat(data_path).st_mtime_ns)
+    except (OSError, ValueError):
         return 0
 
 
@@ -166,31 +162,29 @@ def _cached_db_columns(
         return tuple()
 
     try:
+        described: dict[str, tuple[str, list[tuple[str, str]]]] = {}
+        for table, name, dtype in con.execute(
+            "SELECT table_name, column_name, data_type FROM information_schema.columns "
+            "WHERE table_schema = 'main' ORDER BY table_name, ordinal_position"
+        ).fetchall():
+            table_text = str(table or "").strip()
+            name_text = str(name or "").strip()
+            if not table_text or not name_text:
+                continue
+            entry = described.setdefault(table_text.lower(), (table_text, []))
+            entry[1].append((name_text, str(dtype or "").strip()))
+
         if requested_table:
             candidate_tables = [requested_table]
         elif scoped_tables:
             candidate_tables = list(scoped_tables)
         else:
-            rows = con.execute(
-                "SELECT table_name FROM information_schema.tables "
-                "WHERE table_schema = 'main' ORDER BY table_name"
-            ).fetchall()
-            candidate_tables = [str(row[0]).strip() for row in rows if row and str(row[0]).strip()]
+            candidate_tables = [table for table, _ in described.values()]
 
         columns: list[tuple[str, str, str]] = []
         for table in candidate_tables:
-            try:
-                describe_rows = con.execute(f"DESCRIBE {_quote_identifier(table)}").fetchall()
-            except Exception:
-                continue
-            for row in describe_rows:
-                if not row:
-                    continue
-                name = str(row[0] or "").strip()
-                if not name:
-                    continue
-                dtype = str(row[1] or "").strip() if len(row) > 1 else ""
-                columns.append((str(table).strip(), name, dtype))
+            _, table_columns = described.get(str(table).strip().lower(), ("", []))
+            columns.extend((str(table).strip(), name, dtype) for name, dtype in table_columns)
         return tuple(columns)
     finally:
         con.close()
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from datetime import date, datetime, time
 from decimal import Decimal
+import json
 import math
 from pathlib import Path
 from typing import Any
@@ -11,7 +12,13 @@ from uuid import UUID
 
 import duckdb
 
+from .adapters.file import _cursor
 from .errors import AdapterError
+from .stat_cache import StatCache
+
+MAX_CACHED_COUNTS = 256
+
+_counts: StatCache[int] = StatCache(MAX_CACHED_COUNTS)
 
 
 def _quoted(identifier: str) -> str:
@@ -39,9 +46,25 @@ def _schema(connection: duckdb.DuckDBPyConnection, path: Path) -> list[dict[str,
     return [{"name": str(row[0]), "type": str(row[1])} for row in rows]
 
 
+def _filtered_count(
+    connection: duckdb.DuckDBPyConnection, path: Path, where_sql: str, params: list[Any]
+) -> int:
+    return _counts.get(
+        path,
+        lambda: int(
+            connection.execute(
+                f"SELECT COUNT(*) FROM read_parquet(?) {where_sql}",
+                [str(path), *params],
+            ).fetchone()[0]
+        ),
+        where_sql,
+        json.dumps(params, default=str),
+    )
+
+
 def inspect_parquet(value: str) -> dict[str, Any]:
     path = _path(value)
-    connection = duckdb.connect()
+    connection = _cursor()
     try:
         schema = _schema(connection, path)
         count = connection.execute(
@@ -192,7 +215,7 @@ def query_parquet(
             "artifact_page_invalid",
             "Artifact offset must be non-negative and limit must be between 1 and 1000.",
         )
-    connection = duckdb.connect()
+    connection = _cursor()
     try:
         schema = _schema(connection, path)
         names = [column["name"] for column in schema]
@@ -227,12 +250,7 @@ def query_parquet(
             if name in allowed and direction in {"asc", "desc"}:
                 orders.append(f"{_quoted(name)} {direction.upper()}")
         order_sql = "ORDER BY " + ", ".join(orders) if orders else ""
-        total = int(
-            connection.execute(
-                f"SELECT COUNT(*) FROM read_parquet(?) {where_sql}",
-                [str(path), *params],
-            ).fetchone()[0]
-        )
+        total = _filtered_count(connection, path, where_sql, params)
         cursor = connection.execute(
             f"SELECT * FROM read_parquet(?) {where_sql} {order_sql} LIMIT ? OFFSET ?",
             [str(path), *params, limit, offset],
@@ -52,7 +52,7 @@ def _existing_fingerprint(path: Path) -> str:
             return str(row[0]) if row else ""
         finally:
             connection.close()
-    except Exception:
+    except (OSError, duckdb.Error):
         return ""
 
 
@@ -154,15 +154,21 @@ def build_catalog(params: dict[str, Any]) -> CatalogBuild:
     try:
         connection = duckdb.connect(str(temporary))
         try:
+            connection.execute("BEGIN TRANSACTION")
             connection.execute("CREATE SCHEMA inquira_internal")
             connection.execute("CREATE TABLE inquira_internal.catalog_metadata(fingerprint VARCHAR NOT NULL)")
             connection.execute("INSERT INTO inquira_internal.catalog_metadata VALUES (?)", [fingerprint])
             connection.execute("CREATE TABLE inquira_internal.catalog_tables(id VARCHAR NOT NULL, name VARCHAR NOT NULL, snapshot_path VARCHAR NOT NULL)")
-            for table_id, name, snapshot in normalized:
-                connection.execute("INSERT INTO inquira_internal.catalog_tables VALUES (?, ?, ?)", [table_id, name, str(snapshot)])
+            if normalized:
+                connection.executemany(
+                    "INSERT INTO inquira_internal.catalog_tables VALUES (?, ?, ?)",
+                    [[table_id, name, str(snapshot)] for table_id, name, snapshot in normalized],
+                )
+            for _, name, snapshot in normalized:
                 connection.execute(
                     f"CREATE VIEW {_identifier(name)} AS SELECT * FROM read_parquet({_sql_string(snapshot)})"
                 )
+            connection.execute("COMMIT")
             connection.execute("CHECKPOINT")
         finally:
             connection.close()
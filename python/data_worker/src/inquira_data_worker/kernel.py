@@ -6,17 +6,19 @@ import ast
 import asyncio
 import inspect
 import json
+import os
 import sys
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from queue import Empty as QueueEmpty
-from typing import Any, Callable
-
-from jupyter_client import AsyncKernelManager
+from typing import TYPE_CHECKING, Any, Callable
 
 from .jupyter_messages import ExecutionOutput
 
+if TYPE_CHECKING:
+    from jupyter_client import AsyncKernelManager
+
 
 @dataclass
 class KernelSession:
@@ -150,8 +152,7 @@ class WorkspaceKernelManager:
         async with self._sessions_lock:
             sessions = list(self._sessions.values())
             self._sessions.clear()
-        for session in sessions:
-            await self._shutdown_session(session)
+        await asyncio.gather(*(self._shutdown_session(session) for session in sessions))
 
     async def _get_or_start(
         self,
@@ -184,6 +185,9 @@ class WorkspaceKernelManager:
         if not database.is_file():
             raise RuntimeError("Workspace catalog is unavailable.")
         await _emit(emit, {"type": "kernel_status", "status": "starting", "workspace_id": workspace_id})
+        # Imported lazily to keep worker start-up fast.
+        from jupyter_client import AsyncKernelManager
+
         manager = AsyncKernelManager(kernel_name="python3")
         kernel_spec = manager.kernel_spec
         if kernel_spec is None:
@@ -310,5 +314,5 @@ async def _await_maybe(value: Any) -> Any:
 
 
 def _database_signature(database_path: str) -> tuple[int, int, int, int]:
-    stat = Path(database_path).expanduser().resolve().stat()
+    stat = os.stat(database_path)
     return (int(stat.st_dev), int(stat.st_ino), int(stat.st_size), int(stat.st_mtime_ns))
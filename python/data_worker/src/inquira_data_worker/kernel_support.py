@@ -165,6 +165,27 @@ def install(namespace: dict[str, Any], *, workspace_id: str, database_path: str)
 
 def _json_safe(value: Any) -> Any:
     try:
-        return json.loads(json.dumps(value, default=str))
+        return _json_plain(value)
     except Exception:
         return str(value)
+
+
+def _json_plain(value: Any) -> Any:
+    if value is None or isinstance(value, (str, bool)):
+        return value
+    if isinstance(value, int):
+        return int(value)
+    if isinstance(value, float):
+        return float(value)
+    if isinstance(value, dict):
+        plain = {}
+        for key, item in value.items():
+            if not isinstance(key, str):
+                if key is not None and not isinstance(key, (int, float)):
+                    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+                key = json.dumps(key)
+            plain[key] = _json_plain(item)
+        return plain
+    if isinstance(value, (list, tuple)):
+        return [_json_plain(item) for item in value]
+    return str(value)
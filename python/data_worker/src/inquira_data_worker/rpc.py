@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, is_dataclass
+from dataclasses import fields, is_dataclass
 from typing import Any
 
 from .adapters.registry import get_adapter
@@ -12,7 +12,11 @@ from .models import AdapterRequest, MaterializeRequest
 
 
 def _result(value: Any) -> Any:
-    return asdict(value) if is_dataclass(value) else value
+    if is_dataclass(value) and not isinstance(value, type):
+        return {item.name: _result(getattr(value, item.name)) for item in fields(value)}
+    if isinstance(value, list):
+        return [_result(item) for item in value]
+    return value
 
 
 def handle_request(request: dict[str, Any]) -> dict[str, Any]:
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Awaitable, Callable
 
 from .langgraph_agent import LangGraphAnalysisAgent
 from .artifacts import inspect_parquet, query_parquet
@@ -15,6 +17,8 @@ from .kernel import WorkspaceKernelManager
 from .rpc import handle_request as handle_data_request
 from .schema_generation import SchemaGenerator
 
+DATA_WORKERS = 4
+
 
 @dataclass(frozen=True)
 class ActiveAgentTask:
@@ -28,6 +32,9 @@ class WorkerRuntime:
         self.agent = LangGraphAnalysisAgent(kernels=self.kernels)
         self.schema_generator = SchemaGenerator()
         self._agent_tasks: dict[str, ActiveAgentTask] = {}
+        self._data_executor = ThreadPoolExecutor(
+            max_workers=DATA_WORKERS, thread_name_prefix="inquira-data"
+        )
 
     async def handle(
         self, request: dict[str, Any], emit: Callable[[dict[str, Any]], Any]
@@ -50,18 +57,12 @@ class WorkerRuntime:
                 )
             method = request["method"]
             if method in {"discover", "preview", "materialize", "build_catalog", "preview_catalog"}:
-                return await asyncio.to_thread(handle_data_request, request)
+                return await self._run_data(handle_data_request, request)
             if method == "ping":
                 response["result"] = {"status": "ready"}
             elif method == "kernel_execute":
                 values = _execution_params(params)
-
-                async def forward(event: dict[str, Any]) -> None:
-                    emitted = emit(event)
-                    if hasattr(emitted, "__await__"):
-                        await emitted
-
-                response["result"] = await self.kernels.execute(**values, emit=forward)
+                response["result"] = await self.kernels.execute(**values, emit=_forwarder(emit))
             elif method == "agent_analyze":
 
                 workspace_id = _workspace_id(params)
@@ -77,14 +78,8 @@ class WorkerRuntime:
                         "worker_internal_error", "The agent task could not be registered."
                     )
                 self._agent_tasks[workspace_id] = ActiveAgentTask(client_request_id, current_task)
-
-                async def forward_agent(event: dict[str, Any]) -> None:
-                    emitted = emit(event)
-                    if hasattr(emitted, "__await__"):
-                        await emitted
-
                 try:
-                    response["result"] = await self.agent.analyze(params, forward_agent)
+                    response["result"] = await self.agent.analyze(params, _forwarder(emit))
                 finally:
                     current = self._agent_tasks.get(workspace_id)
                     if current is not None and current.task is current_task:
@@ -111,7 +106,7 @@ class WorkerRuntime:
             elif method == "command_compile":
                 response["result"] = compile_command(params)
             elif method == "artifact_inspect":
-                response["result"] = await asyncio.to_thread(
+                response["result"] = await self._run_data(
                     inspect_parquet, _artifact_path(params)
                 )
             elif method == "artifact_rows":
@@ -129,7 +124,7 @@ class WorkerRuntime:
                     raise RuntimeRequestError(
                         "invalid_params", "Artifact query models are invalid."
                     )
-                response["result"] = await asyncio.to_thread(
+                response["result"] = await self._run_data(
                     query_parquet,
                     path,
                     offset=offset,
@@ -186,6 +181,11 @@ class WorkerRuntime:
         if tasks:
             await asyncio.gather(*tasks, return_exceptions=True)
         await self.kernels.shutdown()
+        self._data_executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run_data(self, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._data_executor, partial(function, *args, **kwargs))
 
 
 class RuntimeRequestError(Exception):
@@ -195,6 +195,15 @@ class RuntimeRequestError(Exception):
         self.message = message
 
 
+def _forwarder(emit: Callable[[dict[str, Any]], Any]) -> Callable[[dict[str, Any]], Awaitable[None]]:
+    async def forward(event: dict[str, Any]) -> None:
+        emitted = emit(event)
+        if hasattr(emitted, "__await__"):
+            await emitted
+
+    return forward
+
+
 def _workspace_id(params: dict[str, Any]) -> str:
     value = params.get("workspace_id")
     if (
@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import re
+from collections import OrderedDict
+from dataclasses import asdict
 from pathlib import Path
 from typing import Any, Callable
 
 from .model_client import ModelSettings, create_model_client
 
+MAX_RETAINED_RESPONSES = 256
+
+_NAME_SEPARATORS_RE = re.compile(r"[^\w]+", re.UNICODE)
+
 
 class SchemaGenerator:
     def __init__(
@@ -16,40 +24,86 @@ class SchemaGenerator:
         *,
         model_factory: Callable[[dict[str, Any]], Any] = create_model_client,
         batch_size: int = 20,
+        concurrency: int = 4,
     ) -> None:
         self.model_factory = model_factory
         self.batch_size = max(1, min(int(batch_size), 50))
+        self.concurrency = max(1, min(int(concurrency), 8))
+        self._retained: OrderedDict[str, str] = OrderedDict()
 
     async def generate(self, params: dict[str, Any]) -> dict[str, Any]:
         values = validate_schema_request(params)
         model = self.model_factory(values["model"])
+        scope = _model_scope(values["model"])
+        columns = values["columns"]
+        limit = asyncio.Semaphore(self.concurrency)
+        stopped = asyncio.Event()
+        completed: dict[str, str] = {}
+        outcomes = await asyncio.gather(
+            *(
+                self._complete_batch(
+                    model, scope, values["table_name"], values["context"],
+                    columns[start:start + self.batch_size], limit, stopped, completed,
+                )
+                for start in range(0, len(columns), self.batch_size)
+            ),
+            return_exceptions=True,
+        )
+        failure = next((outcome for outcome in outcomes if isinstance(outcome, BaseException)), None)
+        if failure is not None:
+            for key, raw in completed.items():
+                self._retained[key] = raw
+                self._retained.move_to_end(key)
+            while len(self._retained) > MAX_RETAINED_RESPONSES:
+                self._retained.popitem(last=False)
+            raise failure
         generated: list[dict[str, Any]] = []
         seen_aliases: set[str] = set()
-        for start in range(0, len(values["columns"]), self.batch_size):
-            batch = values["columns"][start:start + self.batch_size]
-            generated.extend(await self._generate_batch(
-                model, values["table_name"], values["context"], batch, seen_aliases
-            ))
+        for pieces in outcomes:
+            for batch, raw in pieces:
+                generated.extend(_generated_columns(raw, batch, seen_aliases))
         return {"columns": generated}
 
-    async def _generate_batch(
+    async def _complete_batch(
         self,
         model: Any,
+        scope: str,
         table_name: str,
         context: str,
         columns: list[dict[str, Any]],
-        seen_aliases: set[str],
-    ) -> list[dict[str, Any]]:
-        try:
-            raw = await model.complete(_messages(table_name, context, columns))
-        except Exception as exc:
-            if len(columns) > 1 and _is_length_failure(exc):
-                middle = len(columns) // 2
-                left = await self._generate_batch(model, table_name, context, columns[:middle], seen_aliases)
-                right = await self._generate_batch(model, table_name, context, columns[middle:], seen_aliases)
-                return left + right
-            raise
-        return _generated_columns(raw, columns, seen_aliases)
+        limit: asyncio.Semaphore,
+        stopped: asyncio.Event,
+        completed: dict[str, str],
+    ) -> list[tuple[list[dict[str, Any]], str]] | None:
+        messages = _messages(table_name, context, columns)
+        key = _prompt_key(scope, messages)
+        raw = self._retained.pop(key, None)
+        if raw is None:
+            try:
+                async with limit:
+                    # Batches already queued on the semaphore stop here too.
+                    if stopped.is_set():
+                        return None
+                    raw = await model.complete(messages)
+            except Exception as exc:
+                if len(columns) > 1 and _is_length_failure(exc):
+                    middle = len(columns) // 2
+                    left = await self._complete_batch(
+                        model, scope, table_name, context, columns[:middle], limit, stopped, completed
+                    )
+                    right = await self._complete_batch(
+                        model, scope, table_name, context, columns[middle:], limit, stopped, completed
+                    )
+                    return None if left is None or right is None else left + right
+                stopped.set()
+                raise
+            try:
+                _generated_columns(raw, columns, set())
+            except Exception:
+                stopped.set()
+                raise
+        completed[key] = raw
+        return [(columns, raw)]
 
 
 def validate_schema_request(params: dict[str, Any]) -> dict[str, Any]:
@@ -135,6 +189,17 @@ def _messages(table_name: str, context: str, columns: list[dict[str, Any]]) -> l
     ]
 
 
+def _model_scope(model: dict[str, Any]) -> str:
+    settings = asdict(ModelSettings.from_dict(model))
+    settings.pop("api_key")
+    return json.dumps(settings, sort_keys=True)
+
+
+def _prompt_key(scope: str, messages: list[dict[str, str]]) -> str:
+    payload = json.dumps([scope, messages], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
 def _generated_columns(raw: str, requested: list[dict[str, Any]], seen_aliases: set[str]) -> list[dict[str, Any]]:
     payload = _json_object(raw)
     items = payload.get("columns")
@@ -208,7 +273,7 @@ def _json_object(raw: str) -> dict[str, Any]:
 
 
 def _normalize_name(value: str) -> str:
-    return re.sub(r"[^\w]+", "", value, flags=re.UNICODE).casefold()
+    return _NAME_SEPARATORS_RE.sub("", value).casefold()
 
 
 def _is_length_failure(exc: Exception) -> bool:
@@ -0,0 +1,46 @@
+"""Bounded caches of values derived from files, keyed by their stat identity."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from pathlib import Path
+from typing import Generic, TypeVar
+
+# FAT's two-second tick is the coarsest common mtime resolution.
+RACY_WINDOW_NS = 2_000_000_000
+
+T = TypeVar("T")
+
+
+def _stat_key(path: Path) -> tuple[str, int, int, int, int, int]:
+    status = os.stat(path)
+    return (
+        str(path), status.st_dev, status.st_ino, status.st_size, status.st_mtime_ns, status.st_ctime_ns
+    )
+
+
+class StatCache(Generic[T]):
+    def __init__(self, max_entries: int) -> None:
+        self._entries: OrderedDict[tuple[Hashable, ...], T] = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+
+    def get(self, path: Path, compute: Callable[[], T], *variant: Hashable) -> T:
+        identity = _stat_key(path)
+        key = (identity, *variant)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        value = compute()
+        if _stat_key(path) == identity and time.time_ns() - identity[4] >= RACY_WINDOW_NS:
+            with self._lock:
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+        return value
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import time
 from pathlib import Path
 
 import duckdb
@@ -95,3 +97,26 @@ def test_artifact_rows_normalize_non_finite_and_nested_values_for_json(
     connection.close()
     page = query_parquet(str(path), offset=0, limit=10)
     assert page["rows"] == [{"score": None, "values": [1, 2]}]
+
+
+def test_artifact_row_count_is_recounted_when_the_file_is_replaced(
+    tmp_path: Path,
+) -> None:
+    path = _parquet(tmp_path)
+    settled = time.time_ns() - 60_000_000_000
+    os.utime(path, ns=(settled, settled))
+    north = {"region": {"filterType": "text", "type": "startsWith", "filter": "north"}}
+    assert query_parquet(str(path), offset=0, limit=1, filter_model=north)["row_count"] == 2
+    assert query_parquet(str(path), offset=1, limit=1, filter_model=north)["row_count"] == 2
+
+    connection = duckdb.connect()
+    connection.execute(
+        "COPY (SELECT * FROM VALUES (1, 'North'), (2, 'North'), (3, 'North east') "
+        "t(id, region)) TO ? (FORMAT PARQUET)",
+        [str(path)],
+    )
+    connection.close()
+    os.utime(path, ns=(settled, settled))
+    page = query_parquet(str(path), offset=2, limit=1, filter_model=north)
+    assert page["row_count"] == 3
+    assert page["rows"] == [{"id": 3, "region": "North east"}]
@@ -5,7 +5,7 @@ from pathlib import Path
 import duckdb
 import pytest
 
-from inquira_data_worker.catalog import build_catalog
+from inquira_data_worker.catalog import build_catalog, preview_catalog
 from inquira_data_worker.errors import AdapterError
 
 
@@ -87,3 +87,54 @@ def test_failed_rebuild_preserves_the_last_good_catalog(tmp_path: Path) -> None:
             "tables": [{"id": "1", "name": 'bad"name', "snapshot_path": str(tmp_path / "missing.parquet")}],
         })
     assert database.read_bytes() == before
+
+
+def test_catalog_preview_reopens_a_rebuilt_catalog(tmp_path: Path) -> None:
+    first = tmp_path / "first.parquet"
+    second = tmp_path / "second.parquet"
+    parquet(first, "before")
+    parquet(second, "after")
+    database = tmp_path / "workspace.duckdb"
+    params = {"database_path": str(database), "table_name": "data", "mode": "head", "limit": 10}
+
+    build_catalog({
+        "database_path": str(database), "fingerprint": "first",
+        "tables": [{"id": "1", "name": "data", "snapshot_path": str(first)}],
+    })
+    assert preview_catalog(params).rows == [{"id": 1, "label": "before"}]
+    assert preview_catalog(params).rows == [{"id": 1, "label": "before"}]
+
+    build_catalog({
+        "database_path": str(database), "fingerprint": "second",
+        "tables": [{"id": "1", "name": "data", "snapshot_path": str(second)}],
+    })
+    assert preview_catalog(params).rows == [{"id": 1, "label": "after"}]
+
+
+def test_catalog_reads_see_a_rebuild_once_other_connections_close(tmp_path: Path) -> None:
+    first = tmp_path / "first.parquet"
+    second = tmp_path / "second.parquet"
+    parquet(first, "before")
+    parquet(second, "after")
+    database = tmp_path / "workspace.duckdb"
+    params = {"database_path": str(database), "table_name": "data", "mode": "head", "limit": 10}
+    build_catalog({
+        "database_path": str(database), "fingerprint": "first",
+        "tables": [{"id": "1", "name": "data", "snapshot_path": str(first)}],
+    })
+
+    held = duckdb.connect(str(database), read_only=True)
+    try:
+        build_catalog({
+            "database_path": str(database), "fingerprint": "second",
+            "tables": [{"id": "1", "name": "data", "snapshot_path": str(second)}],
+        })
+        preview_catalog(params)
+    finally:
+        held.close()
+
+    assert preview_catalog(params).rows == [{"id": 1, "label": "after"}]
+    assert build_catalog({
+        "database_path": str(database), "fingerprint": "second",
+        "tables": [{"id": "1", "name": "data", "snapshot_path": str(second)}],
+    }).changed is False
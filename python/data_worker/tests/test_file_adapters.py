@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import csv
+import hashlib
+import os
+import time
 from pathlib import Path
 
 import duckdb
@@ -69,6 +72,12 @@ def test_adapter_rejects_missing_and_directory_sources(kind: str, suffix: str, t
     adapter = get_adapter(kind)
     with pytest.raises(AdapterError, match="does not exist"):
         adapter.discover(AdapterRequest(source_path=str(tmp_path / f"missing{suffix}")))
+    loop = tmp_path / f"loop{suffix}"
+    loop.symlink_to(loop)
+    with pytest.raises(AdapterError, match="does not exist"):
+        adapter.discover(AdapterRequest(source_path=str(loop)))
+    with pytest.raises(AdapterError, match="does not exist"):
+        adapter.discover(AdapterRequest(source_path=str(tmp_path / f"nul\x00{suffix}")))
     with pytest.raises(AdapterError, match="regular file"):
         adapter.discover(AdapterRequest(source_path=str(tmp_path)))
 
@@ -188,3 +197,34 @@ def test_fingerprint_is_stable_until_source_content_changes(tmp_path: Path) -> N
     write_csv(path, [["id"], [1], [2]])
     third = adapter.discover(AdapterRequest(source_path=str(path))).fingerprint
     assert third != first
+
+
+def test_fingerprint_skips_rehashing_an_unchanged_source(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "cached.csv"
+    write_csv(path, [["id"], [1]])
+    settled = time.time_ns() - 60_000_000_000
+    os.utime(path, ns=(settled, settled))
+    digests: list[object] = []
+    sha256 = hashlib.sha256
+    monkeypatch.setattr(hashlib, "sha256", lambda *args: digests.append(args) or sha256(*args))
+    adapter = get_adapter("csv")
+    first = adapter.discover(AdapterRequest(source_path=str(path))).fingerprint
+    second = adapter.discover(AdapterRequest(source_path=str(path))).fingerprint
+    assert first == second
+    assert len(digests) == 1
+    write_csv(path, [["id"], [20]])
+    os.utime(path, ns=(settled + 1_000_000_000, settled + 1_000_000_000))
+    assert adapter.discover(AdapterRequest(source_path=str(path))).fingerprint != first
+    assert len(digests) == 2
+
+
+def test_fingerprint_rehashes_a_recently_modified_source(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "fresh.csv"
+    write_csv(path, [["id"], [1]])
+    digests: list[object] = []
+    sha256 = hashlib.sha256
+    monkeypatch.setattr(hashlib, "sha256", lambda *args: digests.append(args) or sha256(*args))
+    adapter = get_adapter("csv")
+    adapter.discover(AdapterRequest(source_path=str(path)))
+    adapter.discover(AdapterRequest(source_path=str(path)))
+    assert len(digests) == 2
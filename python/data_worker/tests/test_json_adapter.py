@@ -80,3 +80,15 @@ def test_json_adapter_rejects_invalid_sources(
     path.write_text(content, encoding="utf-8")
     with pytest.raises(AdapterError, match=message):
         get_adapter("json").discover(AdapterRequest(source_path=str(path)))
+
+
+def test_json_adapter_reports_malformed_sources_as_unreadable_when_materializing(tmp_path: Path) -> None:
+    path = tmp_path / "broken.json"
+    path.write_text('{"id": 1,, ]', encoding="utf-8")
+    target = tmp_path / "snapshot"
+    with pytest.raises(AdapterError, match="Could not read json source") as error:
+        get_adapter("json").materialize(MaterializeRequest(
+            source_path=str(path), target_dir=str(target), selected_object_ids=["file"],
+        ))
+    assert error.value.code == "source_unreadable"
+    assert not (target / "data.parquet").exists()
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
 import asyncio
+import datetime as dt
+import enum
+import json
 import os
+from decimal import Decimal
 from pathlib import Path
+from typing import Any
 
 import duckdb
+import numpy
+import pytest
 
 from inquira_data_worker.kernel import WorkspaceKernelManager
+from inquira_data_worker.kernel_support import _json_safe
 
 
 def create_catalog(path: Path) -> None:
@@ -233,3 +241,47 @@ def test_workspace_kernel_reconnects_when_catalog_is_atomically_replaced(tmp_pat
             await manager.shutdown()
 
     asyncio.run(scenario())
+
+
+
+class Level(enum.IntEnum):
+    HIGH = 3
+
+
+def _circular_list() -> list[Any]:
+    value: list[Any] = [1]
+    value.append(value)
+    return value
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        "text",
+        True,
+        7,
+        2.5,
+        float("nan"),
+        float("inf"),
+        numpy.float64(1.25),
+        numpy.int64(4),
+        numpy.bool_(True),
+        numpy.arange(3),
+        Decimal("1.10"),
+        dt.datetime(2025, 1, 2, 3, 4, 5),
+        Level.HIGH,
+        (1, (2, 3)),
+        {1: "int", 2.5: "float", None: "none", False: "bool", Level.HIGH: "enum"},
+        {(1, 2): "tuple key"},
+        {"nested": [{"x": numpy.array([1.0, float("nan")]), "when": dt.date(2025, 1, 2)}]},
+        {"data": [{"type": "scatter", "x": [1, 2], "y": numpy.array([3.0, 4.0])}], "layout": {"title": {"text": "t"}}},
+        _circular_list(),
+    ],
+)
+def test_json_safe_matches_a_json_round_trip(value: Any) -> None:
+    try:
+        expected = json.loads(json.dumps(value, default=str))
+    except Exception:
+        expected = str(value)
+    assert json.dumps(_json_safe(value)) == json.dumps(expected)
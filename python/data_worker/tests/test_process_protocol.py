@@ -189,3 +189,32 @@ def test_json_lines_process_runs_agent_from_model_to_duckdb_result(tmp_path: Pat
         if process.poll() is None:
             process.kill()
     assert process.returncode == 0
+
+
+def test_json_lines_process_answers_invalid_utf8_and_keeps_serving() -> None:
+    process = subprocess.Popen(
+        [sys.executable, "-m", "inquira_data_worker"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    assert process.stdin is not None
+    assert process.stdout is not None
+    try:
+        process.stdin.write(b'{"id": "bad", "method": "ping", "params": "\xff\xfe"}\n')
+        process.stdin.flush()
+        rejected = json.loads(process.stdout.readline())
+        assert rejected["id"] is None
+        assert rejected["error"]["code"] == "invalid_json"
+
+        process.stdin.write(b'{"id": "next", "method": "ping", "params": {}}\n')
+        process.stdin.flush()
+        answered = json.loads(process.stdout.readline())
+        assert answered["id"] == "next"
+        assert answered["error"] is None
+    finally:
+        process.stdin.close()
+        process.wait(timeout=15)
+        if process.poll() is None:
+            process.kill()
+    assert process.returncode == 0
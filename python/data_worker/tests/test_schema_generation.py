@@ -76,3 +76,87 @@ def test_schema_generator_splits_length_limited_batches_until_they_fit() -> None
 def test_schema_request_validation_rejects_invalid_or_unbounded_inputs(params: dict) -> None:
     with pytest.raises(ValueError):
         validate_schema_request(params)
+
+
+def test_schema_generator_retry_reuses_batches_from_a_failed_generation() -> None:
+    class FlakyModel(FakeModel):
+        def __init__(self) -> None:
+            super().__init__()
+            self.fail_on = {"column_4"}
+
+        async def complete(self, messages: list[dict[str, str]]) -> str:
+            if any(name in messages[-1]["content"] for name in self.fail_on):
+                self.prompts.append(messages)
+                raise RuntimeError("provider unavailable")
+            return await super().complete(messages)
+
+    async def scenario() -> None:
+        model = FlakyModel()
+        generator = SchemaGenerator(model_factory=lambda _: model, batch_size=2)
+        params = {
+            "workspace_id": "workspace-1", "table_name": "sales", "context": "",
+            "columns": [{"name": f"column_{index}", "dtype": "VARCHAR", "nullable": True} for index in range(5)],
+            "model": {"provider": "openai", "model": "gpt-lite", "api_key": "secret", "base_url": "https://example.test"},
+        }
+        with pytest.raises(RuntimeError):
+            await generator.generate(params)
+        assert len(model.prompts) == 3
+
+        model.fail_on = set()
+        retried = await generator.generate(params)
+        assert len(model.prompts) == 4
+        assert [item["name"] for item in retried["columns"]] == ["column_1", "column_0", "column_3", "column_2", "column_4"]
+
+        await generator.generate(params)
+        assert len(model.prompts) == 7
+
+    asyncio.run(scenario())
+
+
+def test_schema_generator_requests_batches_concurrently_and_merges_in_order() -> None:
+    class SlowModel(FakeModel):
+        def __init__(self) -> None:
+            super().__init__()
+            self.active = 0
+            self.peak = 0
+
+        async def complete(self, messages: list[dict[str, str]]) -> str:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(0.01 if "column_0" in messages[-1]["content"] else 0)
+            self.active -= 1
+            return await super().complete(messages)
+
+    async def scenario() -> None:
+        model = SlowModel()
+        generator = SchemaGenerator(model_factory=lambda _: model, batch_size=1, concurrency=3)
+        result = await generator.generate({
+            "workspace_id": "workspace-1", "table_name": "sales", "context": "",
+            "columns": [{"name": f"column_{index}", "dtype": "VARCHAR", "nullable": True} for index in range(6)],
+            "model": {"provider": "openai", "model": "gpt-lite", "api_key": "secret", "base_url": "https://example.test"},
+        })
+        assert model.peak == 3
+        assert [item["name"] for item in result["columns"]] == [f"column_{index}" for index in range(6)]
+
+    asyncio.run(scenario())
+
+
+def test_schema_generator_stops_sending_batches_after_a_failure() -> None:
+    class RejectingModel(FakeModel):
+        async def complete(self, messages: list[dict[str, str]]) -> str:
+            self.prompts.append(messages)
+            await asyncio.sleep(0)
+            raise RuntimeError("invalid api key")
+
+    async def scenario() -> None:
+        model = RejectingModel()
+        generator = SchemaGenerator(model_factory=lambda _: model, batch_size=1, concurrency=2)
+        with pytest.raises(RuntimeError, match="invalid api key"):
+            await generator.generate({
+                "workspace_id": "workspace-1", "table_name": "sales", "context": "",
+                "columns": [{"name": f"column_{index}", "dtype": "VARCHAR", "nullable": True} for index in range(50)],
+                "model": {"provider": "openai", "model": "gpt-lite", "api_key": "bad", "base_url": "https://example.test"},
+            })
+        assert len(model.prompts) == 2
+
+    asyncio.run(scenario())
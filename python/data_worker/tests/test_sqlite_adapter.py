@@ -92,6 +92,33 @@ def test_sqlite_materializes_selected_tables_and_views_independently(tmp_path: P
         assert duckdb.sql(f"SELECT count(*) FROM read_parquet('{output_path}')").fetchone()[0] == 2
 
 
+def test_sqlite_materialization_keeps_values_and_order_across_batches(tmp_path: Path) -> None:
+    source = tmp_path / "large.sqlite"
+    connection = sqlite3.connect(source)
+    try:
+        connection.execute("CREATE TABLE events (id INTEGER, label TEXT, ratio REAL, payload BLOB)")
+        connection.executemany(
+            "INSERT INTO events VALUES (?, ?, ?, ?)",
+            [(index, None if index % 7 == 0 else f"row {index}", index / 4, bytes([index % 256])) for index in range(2500)],
+        )
+        connection.commit()
+    finally:
+        connection.close()
+
+    result = get_adapter("sqlite").materialize(MaterializeRequest(
+        source_path=str(source),
+        target_dir=str(tmp_path / "snapshot"),
+        selected_object_ids=["table:events"],
+    ))
+
+    output_path = tmp_path / "snapshot" / result.outputs[0].relative_path
+    rows = duckdb.sql(f"SELECT * FROM read_parquet('{output_path}')").fetchall()
+    assert len(rows) == 2500
+    assert rows[0] == (0, None, 0.0, b"\x00")
+    assert rows[1002] == (1002, "row 1002", 250.5, bytes([1002 % 256]))
+    assert [row[0] for row in rows] == list(range(2500))
+
+
 def test_sqlite_fingerprint_changes_when_source_changes(tmp_path: Path) -> None:
     path = tmp_path / "refresh.sqlite"
     create_database(path)